@@ -1,21 +1,59 @@
+from collections import defaultdict
 from pulp import *
-import pandas as pd
-import re
-
-
-def solve_problem_using_pulp(data_file):
-    """solve the problem using pulp and print results"""
-    ### Load data ###
-
-    # Open json file with data
-    f = open(data_file)
-
-    # Returns the data as a dictionary
-    data = json.load(f)
-
-    # Close the file
-    f.close()
+import numpy as np
+import orjson
+import sys
+
+# Print the result tables as pandas DataFrames only if the script is run with --as-frame,
+# otherwise they are printed as plain text and pandas is not imported
+PRINT_AS_FRAME = "--as-frame" in sys.argv[1:]
+
+
+def load_data(data_file):
+    """load the data file and return the objects that the optimization model needs"""
+    # Read the json file with data as bytes and parse it into a dictionary
+    with open(data_file, "rb") as f:
+        data = orjson.loads(f.read())
+
+    # Transportation costs for each source and customer, set with the available combinations
+    # of sources and customers and customers reachable from each source, all of them filled
+    # in a single pass over the data
+    pTransportationCosts = {}
+    sSources_Customers = set()
+    sCustomers_by_Source = defaultdict(list)
+    for item in data["pTransportationCosts"]:
+        s, c = item["index"]
+        pTransportationCosts[s, c] = item["value"]
+        sSources_Customers.add((s, c))
+        sCustomers_by_Source[s].append(c)
 
+    # Quantity that is mandatory to move between each source and customer
+    # (only non-zero quantities for available combinations of sources and customers)
+    pFixedTransportation = {}
+    for item in data["pFixedTransportation"]:
+        s, c = item["index"]
+        if item["value"] and (s, c) in sSources_Customers:
+            pFixedTransportation[s, c] = item["value"]
+
+    # Number each route (available combination of a source and a customer), ordered by source, so that
+    # all the ways of solving the problem use the same order for the decision variables
+    sRoutes = [(s, c) for s in data["sSources"] for c in sCustomers_by_Source[s]]
+
+    return {
+        "sSources": data["sSources"],
+        "sCustomers": data["sCustomers"],
+        "pSourceProduction": data["pSourceProduction"],
+        "pCustomerDemand": data["pCustomerDemand"],
+        "pTransportationCosts": pTransportationCosts,
+        "sSources_Customers": sSources_Customers,
+        "sRoutes": sRoutes,
+        "pFixedTransportation": pFixedTransportation,
+    }
+
+
+def build_model(data):
+    """create the optimization model for the data returned by load_data and return it with its decision
+    variables, both by route and in an array indexed by route number"""
     ### Create the objects that the optimization model needs ###
 
     # Lists with sources and customers
@@ -26,39 +64,46 @@ def solve_problem_using_pulp(data_file):
     pSourceProduction = data["pSourceProduction"]
     pCustomerDemand = data["pCustomerDemand"]
 
-    # Transportation costs for each source and customer
-    pTransportationCosts = {tuple(item["index"]): item["value"] for item in data["pTransportationCosts"]}
+    # Transportation costs, numbered routes and quantities that are mandatory to move
+    # between sources and customers
+    pTransportationCosts = data["pTransportationCosts"]
+    routes = data["sRoutes"]
+    pFixedTransportation = data["pFixedTransportation"]
 
-    # List with the available combinations of sources and customers
-    sSources_Customers = [tuple(item["index"]) for item in data["pTransportationCosts"]]
-
-    # Quantity that is mandatory to move between each source and customer
-    pFixedTransportation = {tuple(item["index"]): item["value"] for item in data["pFixedTransportation"]}
+    # Find the route numbers of each source and of each customer
+    routes_by_Source = defaultdict(list)
+    routes_by_Customer = defaultdict(list)
+    for i, (s, c) in enumerate(routes):
+        routes_by_Source[s].append(i)
+        routes_by_Customer[c].append(i)
 
     ### Create the model ###
 
     # Instantiate the model class
     model = LpProblem("Network_flows_optimization", LpMinimize)
 
-    # Create the decision variables
+    # Create the decision variables, one for each route
     vQuantityExchanged = LpVariable.dicts(
         "quantity_in_tons",
-        ((s, c) for s in sSources for c in sCustomers if (s, c) in sSources_Customers),
+        routes,
         lowBound=0,
         cat='Continuous')
 
+    # Keep the decision variables also in an array indexed by route number, so building the
+    # objective function and the constraints does not need to hash a tuple for each term
+    aQuantityExchanged = np.empty(len(routes), dtype=object)
+    for i, route in enumerate(routes):
+        aQuantityExchanged[i] = vQuantityExchanged[route]
+
     # Create objective function
-    model += lpSum([
-        pTransportationCosts[s, c] * vQuantityExchanged[s, c]
-        for s in sSources for c in sCustomers if (s, c) in sSources_Customers
-    ])
+    model += LpAffineExpression(zip(aQuantityExchanged, (pTransportationCosts[route] for route in routes)))
 
     # Create the constraints
 
     # Production limit for each source
     for s in sSources:
         model += (
-            lpSum([vQuantityExchanged[s, c] for c in sCustomers if (s, c) in sSources_Customers])
+            LpAffineExpression((aQuantityExchanged[i], 1) for i in routes_by_Source[s])
             <= pSourceProduction[s],
             "c01_production_%s" % s
         )
@@ -66,162 +111,369 @@ def solve_problem_using_pulp(data_file):
     # Demand limit for each customer
     for c in sCustomers:
         model += (
-            lpSum([vQuantityExchanged[s, c] for s in sSources if (s, c) in sSources_Customers])
+            LpAffineExpression((aQuantityExchanged[i], 1) for i in routes_by_Customer[c])
             >= pCustomerDemand[c],
             "c02_demand_%s" % c
         )
 
     # Quantity that is mandatory to move between each source and each customer
-    for s in sSources:
-        for c in sCustomers:
-            if (s, c) in sSources_Customers and pFixedTransportation[s, c]:
-                model += (
-                        vQuantityExchanged[s, c] == pFixedTransportation[s, c],
-                        "c03_fixed_%s_%s" % (s, c)
-                )
+    for (s, c), quantity in pFixedTransportation.items():
+        model += (
+                vQuantityExchanged[s, c] == quantity,
+                "c03_fixed_%s_%s" % (s, c)
+        )
 
     ### Export the formulation to a file ###
     # model.writeLP("formulation.pl")
 
+    return model, vQuantityExchanged, aQuantityExchanged
+
+
+def update_model(model, vQuantityExchanged, data):
+    """change the costs, limits and fixed quantities of a model created with build_model to the ones of
+    the data returned by load_data, which must have the same sources, customers and routes"""
+    if data["sSources_Customers"] != vQuantityExchanged.keys():
+        raise ValueError("The data does not have the same routes as the model")
+
+    # Objects used in every iteration of the loops below, looked up only once
+    objective = model.objective
+    constraints = model.constraints
+    pTransportationCosts = data["pTransportationCosts"]
+    pSourceProduction = data["pSourceProduction"]
+    pCustomerDemand = data["pCustomerDemand"]
+
+    # Transportation costs in the objective function
+    for route, v in vQuantityExchanged.items():
+        objective[v] = pTransportationCosts[route]
+
+    # Production limit for each source and demand limit for each customer
+    for s in data["sSources"]:
+        constraints["c01_production_%s" % s].changeRHS(pSourceProduction[s])
+    for c in data["sCustomers"]:
+        constraints["c02_demand_%s" % c].changeRHS(pCustomerDemand[c])
+
+    # Quantities that are mandatory to move, which can be on different routes than before
+    for name in [name for name in constraints if name.startswith("c03_fixed_")]:
+        del constraints[name]
+    for (s, c), quantity in data["pFixedTransportation"].items():
+        model += (
+                vQuantityExchanged[s, c] == quantity,
+                "c03_fixed_%s_%s" % (s, c)
+        )
+
+
+def solve_model(model, vQuantityExchanged, aQuantityExchanged, data, initial_values=None):
+    """solve a model created with build_model using pulp, print results and return the quantity exchanged
+    on each route. If the quantities of a previous solution are given in initial_values, they are used
+    as a warm start"""
+    # Start from the quantities of a previous solution, if any
+    if initial_values:
+        for (s, c), quantity in initial_values.items():
+            if (s, c) in vQuantityExchanged:
+                vQuantityExchanged[s, c].setInitialValue(quantity)
+
     ### Solve the model ###
 
     # If we want to review the available solvers, we can use...
     # solver_list = listSolvers(onlyAvailable=True)
     # print(solver_list)
 
-    # Select the solver
-    solver = getSolver('PULP_CBC_CMD')
+    # Select the solver. We keep CBC because the sensibility analysis needs the shadow prices
+    # and reduced costs, which the HiGHS interfaces of this pulp version do not return.
+    # The solver log is not shown and the temporary files are removed after solving
+    solver = getSolver('PULP_CBC_CMD', msg=False, keepFiles=False, warmStart=bool(initial_values))
 
     # We can change some solver options before solving (such as the maximum time limit),
     # but it is not relevant in this problem because it is easy to solve
-    # solver = getSolver('PULP_CBC_CMD', timeLimit=10)
+    # solver = getSolver('PULP_CBC_CMD', msg=False, keepFiles=False, timeLimit=10)
 
     # Solve the model using the chosen solver
     model.solve(solver)
 
     ### Print results ###
+
+    # Read the quantity exchanged on each route once and compute the total cost from these quantities,
+    # instead of evaluating the objective expression again
+    pTransportationCosts = data["pTransportationCosts"]
+    dict_quantity_sources_customers = dict(zip(vQuantityExchanged, (v.varValue for v in aQuantityExchanged)))
+    total_transportation_cost = sum(
+        pTransportationCosts[s, c] * quantity for (s, c), quantity in dict_quantity_sources_customers.items())
+
+    # Columns of the sensibility analysis, filled in a single pass over the constraints and the variables
+    n_constraints = len(model.constraints)
+    constraint_names = np.empty(n_constraints, dtype=object)
+    slacks = np.empty(n_constraints)
+    shadow_prices = np.empty(n_constraints)
+    for i, (name, c) in enumerate(model.constraints.items()):
+        constraint_names[i] = name
+        slacks[i] = c.slack
+        shadow_prices[i] = c.pi
+
+    variables = model.variables()
+    variable_names = np.empty(len(variables), dtype=object)
+    quantities = np.empty(len(variables))
+    reduced_costs = np.empty(len(variables))
+    for i, v in enumerate(variables):
+        variable_names[i] = v.name
+        quantities[i] = v.varValue
+        reduced_costs[i] = v.dj
+
+    # Source and customer of each decision variable, so we do not need to parse the variable names
+    dict_source_customer_variables = {v.name: route for route, v in zip(vQuantityExchanged, aQuantityExchanged)}
+
+    print_results(LpStatus[model.status], total_transportation_cost, dict_quantity_sources_customers,
+                  (constraint_names, slacks, shadow_prices), (variable_names, quantities, reduced_costs),
+                  dict_source_customer_variables, data["sSources"])
+
+    return dict_quantity_sources_customers
+
+
+def solve_problem_using_pulp(data_file, initial_values=None):
+    """solve the problem using pulp, print results and return the quantity exchanged on each route.
+    If the quantities of a previous solution are given in initial_values, they are used as a warm start"""
+    data = load_data(data_file)
+    model, vQuantityExchanged, aQuantityExchanged = build_model(data)
+    return solve_model(model, vQuantityExchanged, aQuantityExchanged, data, initial_values)
+
+
+def solve_problems_using_pulp(data_files):
+    """solve several problems with the same sources, customers and routes using pulp, print results and
+    return the quantity exchanged on each route for each problem. The model of the first problem is reused
+    for the next ones, changing only their costs, limits and fixed quantities, and the solution of the first
+    problem is used as a warm start for the next ones"""
+    data = load_data(data_files[0])
+    model, vQuantityExchanged, aQuantityExchanged = build_model(data)
+    solutions = [solve_model(model, vQuantityExchanged, aQuantityExchanged, data)]
+    for data_file in data_files[1:]:
+        data = load_data(data_file)
+        update_model(model, vQuantityExchanged, data)
+        solutions.append(solve_model(model, vQuantityExchanged, aQuantityExchanged, data, solutions[0]))
+    return solutions
+
+
+def solve_problem_using_highs(data_file):
+    """solve the problem building the constraint matrix directly and passing it to highs through scipy,
+    print results and return the quantity exchanged on each route"""
+    # scipy is only needed by this function, so it is not imported when the problem is solved using pulp
+    from scipy.optimize import linprog
+    from scipy.sparse import coo_matrix, csc_matrix
+
+    ### Load data ###
+    data = load_data(data_file)
+
+    sSources = data["sSources"]
+    sCustomers = data["sCustomers"]
+    pSourceProduction = data["pSourceProduction"]
+    pCustomerDemand = data["pCustomerDemand"]
+    pTransportationCosts = data["pTransportationCosts"]
+    routes = data["sRoutes"]
+    pFixedTransportation = data["pFixedTransportation"]
+
+    ### Create the arrays that the optimization model needs ###
+
+    # Number each source and each customer, the routes (columns of the model) are already numbered
+    route_number = {route: i for i, route in enumerate(routes)}
+    source_number = {s: i for i, s in enumerate(sSources)}
+    customer_number = {c: i for i, c in enumerate(sCustomers)}
+    n_routes, n_sources, n_customers = len(routes), len(sSources), len(sCustomers)
+
+    # Transportation cost, source and customer of each route
+    costs = np.fromiter((pTransportationCosts[route] for route in routes), dtype=float, count=n_routes)
+    route_sources = np.fromiter((source_number[s] for s, c in routes), dtype=np.int64, count=n_routes)
+    route_customers = np.fromiter((customer_number[c] for s, c in routes), dtype=np.int64, count=n_routes)
+
+    ### Create the model ###
+
+    # Inequality constraints: rows 0..n_sources-1 are the production limits (<=) and the next
+    # n_customers rows are the demand limits, multiplied by -1 to write them as <=.
+    # Each route column has exactly two entries, a 1 in the row of its source and a -1 in the row
+    # of its customer, so the matrix is built directly in the column format that highs uses
+    indices = np.empty(2 * n_routes, dtype=np.int64)
+    indices[0::2] = route_sources
+    indices[1::2] = n_sources + route_customers
+    A_ub = csc_matrix(
+        (np.tile([1.0, -1.0], n_routes), indices, np.arange(0, 2 * n_routes + 1, 2)),
+        shape=(n_sources + n_customers, n_routes))
+    b_ub = np.concatenate((
+        np.fromiter((pSourceProduction[s] for s in sSources), dtype=float, count=n_sources),
+        -np.fromiter((pCustomerDemand[c] for c in sCustomers), dtype=float, count=n_customers)))
+
+    # Equality constraints: one row for each quantity that is mandatory to move
+    fixed_routes = list(pFixedTransportation)
+    if fixed_routes:
+        n_fixed = len(fixed_routes)
+        A_eq = coo_matrix(
+            (np.ones(n_fixed),
+             (np.arange(n_fixed), np.fromiter((route_number[route] for route in fixed_routes), dtype=np.int64,
+                                              count=n_fixed))),
+            shape=(n_fixed, n_routes)).tocsr()
+        b_eq = np.fromiter(pFixedTransportation.values(), dtype=float, count=n_fixed)
+    else:
+        A_eq, b_eq = None, None
+
+    ### Solve the model ###
+    result = linprog(costs, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq, bounds=(0, None), method="highs")
+
+    ### Print results ###
+    status = {0: "Optimal", 2: "Infeasible", 3: "Unbounded"}.get(result.status, "Not Solved")
+    if result.x is None:
+        print("\n")
+        print("Solver status: ", status, "\n")
+        return None
+
+    # Round the results of highs to remove the floating point noise of its computations, so the
+    # printed values are the ones that pulp gives (up to the sign of some zeros) and the binding
+    # constraints and the routes that are not used are found comparing with 0 exactly
+    decimals = 9
+    quantities = np.round(result.x, decimals)
+    total_transportation_cost = round(result.fun, decimals)
+    dict_quantity_sources_customers = dict(zip(routes, quantities.tolist()))
+
+    # Slacks and shadow prices with the same sign convention as pulp, so the demand limits
+    # recover the sign that was changed to write them as <=
+    constraint_names = np.array(
+        ["c01_production_%s" % s for s in sSources]
+        + ["c02_demand_%s" % c for c in sCustomers]
+        + ["c03_fixed_%s_%s" % (s, c) for s, c in fixed_routes], dtype=object)
+    slacks = np.round(np.concatenate((result.ineqlin.residual[:n_sources], -result.ineqlin.residual[n_sources:],
+                                      result.eqlin.residual)), decimals)
+    shadow_prices = np.round(np.concatenate((result.ineqlin.marginals[:n_sources],
+                                             -result.ineqlin.marginals[n_sources:],
+                                             result.eqlin.marginals)), decimals)
+    reduced_costs = np.round(result.lower.marginals, decimals)
+
+    # Variables named and sorted as pulp does, with the reduced costs given by the bound duals
+    dict_source_customer_variables = {"quantity_in_tons_('%s',_'%s')" % (s, c): (s, c) for s, c in routes}
+    variable_names = np.array(list(dict_source_customer_variables), dtype=object)
+    order = np.argsort(variable_names)
+
+    print_results(status, total_transportation_cost, dict_quantity_sources_customers,
+                  (constraint_names, slacks, shadow_prices),
+                  (variable_names[order], quantities[order], reduced_costs[order]),
+                  dict_source_customer_variables, sSources)
+
+    return dict_quantity_sources_customers
+
+
+def print_results(status, total_transportation_cost, dict_quantity_sources_customers,
+                  sensibility_analysis_constraints, sensibility_analysis_variables,
+                  dict_source_customer_variables, sources):
+    """print the solution and the sensibility analysis of a solved problem. The sensibility analysis is given
+    as arrays with the names, slacks and shadow prices of the constraints and with the names, values
+    and reduced costs of the variables"""
+    constraint_names, slacks, shadow_prices = sensibility_analysis_constraints
+    variable_names, quantities, reduced_costs = sensibility_analysis_variables
+
     print("\n")
-    print("Solver status: ", LpStatus[model.status], "\n")
+    print("Solver status: ", status, "\n")
 
-    print("Total transportation cost: ", value(model.objective), "\n")
+    print("Total transportation cost: ", total_transportation_cost, "\n")
 
     print("Quantity exchanged between sources and customers:")
-    dict_quantity_sources_customers = {
-        (s, c): value(vQuantityExchanged[s, c])
-        for s in sSources for c in sCustomers if (s, c) in sSources_Customers and value(vQuantityExchanged[s, c]) > 0
-        }
-    df_quantity_sources_customers = pd.DataFrame(dict_quantity_sources_customers.values(),
-                                                 index=pd.MultiIndex.from_tuples(
-                                                     dict_quantity_sources_customers.keys()),
-                                                 columns=['Quantity']
-                                                 ).reset_index(names=['Source', 'Customer'])
-    print(df_quantity_sources_customers)
+    print_table(['Source', 'Customer', 'Quantity'],
+                [(s, c, quantity) for (s, c), quantity in dict_quantity_sources_customers.items() if quantity > 0])
     print("\n")
 
     print("Sensibility analysis - constraints:")
-    list_sensibility_analysis_constraints = [
-        {'Constraint': name, 'Slack': c.slack, 'Shadow price': c.pi}
-        for name, c in model.constraints.items()]
-    df_sensibility_analysis_constraints = pd.DataFrame(list_sensibility_analysis_constraints)
-    print(df_sensibility_analysis_constraints)
+    print_table(['Constraint', 'Slack', 'Shadow price'], list(zip(constraint_names, slacks, shadow_prices)))
     print("\n")
 
     # Conclusions
-    df_sensibility_analysis_constraints[
-        df_sensibility_analysis_constraints['Slack'] == 0
-        ].apply(
-        lambda row:
-        print_conclusions_constraints_sensibility_analysis(row['Constraint'], row['Shadow price'], sSources), axis=1)
+    for name, slack, shadow_price in zip(constraint_names, slacks, shadow_prices):
+        if slack == 0:
+            print_conclusions_constraints_sensibility_analysis(name, shadow_price, sources)
     print("\n")
 
     print("Sensibility analysis - variables:")
-    list_sensibility_analysis_variables = [
-        {'Variable': v.name, 'Value': v.varValue, 'Reduced cost': v.dj}
-        for v in model.variables()]
-    df_sensibility_analysis_variables = pd.DataFrame(list_sensibility_analysis_variables)
-    print(df_sensibility_analysis_variables)
+    print_table(['Variable', 'Value', 'Reduced cost'], list(zip(variable_names, quantities, reduced_costs)))
     print("\n")
 
     # Conclusions
-    df_sensibility_analysis_variables[
-        df_sensibility_analysis_variables['Value'] == 0
-        ].apply(
-        lambda row:
-        print_conclusions_variables_sensibility_analysis(row['Variable'], row['Reduced cost']), axis=1)
+    for name, quantity, reduced_cost in zip(variable_names, quantities, reduced_costs):
+        if quantity == 0:
+            source, customer = dict_source_customer_variables[name]
+            print_conclusions_variables_sensibility_analysis(source, customer, reduced_cost)
     print("\n")
 
 
+def print_table(headers, rows):
+    """print the rows of a table with the given headers, as a pandas DataFrame if PRINT_AS_FRAME is set"""
+    if PRINT_AS_FRAME:
+        import pandas as pd
+        print(pd.DataFrame.from_records(rows, columns=headers))
+    else:
+        print(format_table(headers, rows))
+
+
+def format_table(headers, rows):
+    """return the rows of a table as aligned text, with the headers on top and the row number on the left"""
+    # Text of each cell, with the floats rounded as pandas shows them
+    cells = [["", *headers]] + [
+        [str(i), *(str(round(value, 6)) if isinstance(value, float) else str(value) for value in row)]
+        for i, row in enumerate(rows)]
+    widths = [max(len(line[j]) for line in cells) for j in range(len(headers) + 1)]
+    return "\n".join(
+        "  ".join([line[0].ljust(widths[0])] + [cell.rjust(width) for cell, width in zip(line[1:], widths[1:])])
+        for line in cells)
+
+
+def describe_cost_change(cost_change):
+    """return how the total transportation cost would change, given a shadow price or a reduced cost"""
+    return ("would be reduced by %s euros" % abs(cost_change) if cost_change < 0
+            else "would be increased in %s euros" % cost_change if cost_change > 0
+            else "would remain equal")
+
+
 def print_conclusions_constraints_sensibility_analysis(constraint_name, shadow_price, sources):
     """print conclusions of the constraints sensibility analysis"""
     # Find the constraint number and the constraint location using the constraint name
-    constraint_number = int(str(constraint_name)[2:3])
-    location = str(constraint_name)[-3:]
-    if constraint_number <= 2 and location in sources:
-        if shadow_price < 0:
-            print("The total transportation cost would be reduced by",
-                  abs(shadow_price),
-                  "euros for each additional ton available in", location)
-        elif shadow_price > 0:
-            print("The total transportation cost would be increased in",
-                  shadow_price,
-                  "euros for each additional ton available in", location)
-        else:
-            print("The total transportation cost would remain equal for each additional ton available in", location)
-    elif constraint_number <= 2:
-        if shadow_price < 0:
-            print("The total transportation cost would be reduced by",
-                  abs(shadow_price),
-                  "euros for each additional ton supply at", location)
-        elif shadow_price > 0:
-            print("The total transportation cost would be increased in",
-                  shadow_price,
-                  "euros for each additional ton supply at", location)
-        else:
-            print("The total transportation cost would remain equal for each additional ton supply at", location)
-
-
-def print_conclusions_variables_sensibility_analysis(variable_name, reduced_cost):
+    constraint_number = int(constraint_name[2])
+    location = constraint_name[-3:]
+    if constraint_number <= 2:
+        change = "additional ton available in" if location in sources else "additional ton supply at"
+        print("The total transportation cost", describe_cost_change(shadow_price), "for each", change, location)
+
+
+def print_conclusions_variables_sensibility_analysis(source, customer, reduced_cost):
     """print conclusions of the variables sensibility analysis"""
-    # Find the source and the customer using the variable name
-    list_source_customer = re.findall(r"(?<=[']).{3}(?=['])", variable_name)
-    source = list_source_customer[0]
-    customer = list_source_customer[1]
-    if reduced_cost < 0:
-        print("The total transportation cost would be reduced by",
-              abs(reduced_cost),
-              "euros for each ton supply from", source, "to", customer)
-    elif reduced_cost > 0:
-        print("The total cost would be increased in",
-              reduced_cost,
-              "euros for each ton supply from", source, "to", customer)
-    else:
-        print("The total transportation cost would remain equal for each ton supply from", source, "to", customer)
+    print("The total transportation cost", describe_cost_change(reduced_cost),
+          "for each ton supply from", source, "to", customer)
 
 
 # Solve some transportation problems
 
 # Base case
-solve_problem_using_pulp("./data/data_0.json")
+# Its solution is used as a warm start in the next cases, which are small changes of this one
+base_case_solution = solve_problem_using_pulp("./data/data_0.json")
 
 # Sensibility analysis - sources
 # Using the base case, we move one ton of supply capacity from Gou to Arn and
 # the objetive function improves in 0.2 euros (shadow price for Arn in the base case)
-# solve_problem_using_pulp("./data/data_1.json")
+# solve_problem_using_pulp("./data/data_1.json", base_case_solution)
 
 # Sensibility analysis - customers - 1
 # Using the base case, we increase the demand in Lon in one ton, and
 # we increase one ton of supply capacity in Gou (Gou is the only source for Lon).
 # Then the objetive function gets worse in 2.5 euros (shadow price for Lon in the base case)
-# solve_problem_using_pulp("./data/data_2.json")
+# solve_problem_using_pulp("./data/data_2.json", base_case_solution)
 
 # Sensibility analysis - customers - 2
 # Using the base case, we increase the demand in Ber in one ton, and
 # we increase one ton of supply capacity in Gou (Arn is the only source for Ber).
 # Then the objetive function gets worse in 2.7 euros (shadow price for Ber in the base case)
-# solve_problem_using_pulp("./data/data_3.json")
+# solve_problem_using_pulp("./data/data_3.json", base_case_solution)
 
 # Sensibility analysis - routes
 # Using the base case, we fixed a transportation between Arn and Ams equal to 1 ton,
 # using pFixedTransportation and c03_fixed_%s_%s.
 # The objetive function gets worse in 0.6 euros (reduced cost for the transportation between Arn and Ams)
-# solve_problem_using_pulp("./data/data_4.json")
+# solve_problem_using_pulp("./data/data_4.json", base_case_solution)
+
+# All these cases can also be solved together, reusing the model of the base case and
+# changing only the data that is different in each case
+# solve_problems_using_pulp(["./data/data_%s.json" % i for i in range(5)])
+
+# Any of these cases can also be solved without pulp, building the constraint matrix directly and
+# passing it to highs, which gives the same solution and sensibility analysis once its results
+# are rounded to remove floating point noise
+# solve_problem_using_highs("./data/data_0.json")